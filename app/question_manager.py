@@ -5,14 +5,41 @@ Compatible with Python 3.10+
 """
 import os
 import json
+import sqlite3
 import time
-from threading import Lock
+import atexit
+from threading import Lock, Timer
 import logging
 
 # Initialize logging
 logging.basicConfig(filename='app/logs/errors.log', level=logging.ERROR, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class QuestionManager:
+    LEAVE_SHARDS = 16  # power of two; shard index is hash(username) & (LEAVE_SHARDS - 1)
+    LEAVE_FLUSH_INTERVAL = 5  # seconds between writes of buffered leave counts
+
+    # SQL for the per-request paths, shared so each string is built once
+    _SQL_GET_GLOBAL_DEADLINE = "SELECT CAST(start_time AS INTEGER) + duration FROM global_test WHERE id=1"
+    # Existence checks select a constant so no columns are materialized
+    _SQL_IS_SUBMITTED = "SELECT 1 FROM submissions WHERE username=? AND question=? AND submitted LIMIT 1"
+    # Records a solved question for both submit_answer and mark_submitted; the upsert
+    # keeps the existing row (start_time, attempt_count) on conflict
+    _SQL_MARK_SUBMITTED = """
+        INSERT INTO submissions (username, question, submitted, start_time)
+        VALUES (?, ?, 1, ?)
+        ON CONFLICT(username, question) DO UPDATE SET submitted=1
+    """
+    # Adds buffered leave events onto the stored count
+    _SQL_FLUSH_LEAVES = """
+        INSERT INTO student_metrics (username, leave_count, last_leave_ts)
+        VALUES (?, ?, ?)
+        ON CONFLICT(username) DO UPDATE SET
+            leave_count = leave_count + excluded.leave_count,
+            last_leave_ts = excluded.last_leave_ts
+    """
+    _SQL_GET_ATTEMPTS = "SELECT attempt_count FROM submissions WHERE username = ? AND question = ?"
+    _SQL_IS_LOCKED_OUT = "SELECT locked_out FROM student_metrics WHERE username = ?"
+
     def __init__(self, questions_dir, submissions_dir, logins_path, db_path):
         self.questions_dir = questions_dir
         self.submissions_dir = submissions_dir
@@ -28,14 +55,45 @@ class QuestionManager:
         }
         # Single overall test duration (sum of per-question defaults)
         self.total_time = sum(self.timers.values())
+        # Question text cache: path -> (mtime_ns, contents)
+        self._qtext_cache = {}
+        # Global timer deadline in integer time.monotonic_ns(); None until the test is started
+        self._global_cache = None
+        # Leave events are buffered per shard as (lock, pending counts, last leave ts)
+        self._leave_shards = [(Lock(), {}, {}) for _ in range(self.LEAVE_SHARDS)]
+        # Periodic flush timer; _flush_lock serializes flushes against close()
+        self._flush_lock = Lock()
+        self._flush_timer = None
+        self._closed = False
         self.load_logins()
         self.load_answers()
         self.load_hints()
+        self._connect()
         self._init_db()
+        self._load_global_cache()
+        self._schedule_leave_flush()
+        atexit.register(self.close)
+
+    def close(self):
+        """Stop the leave flush timer, write any buffered leave counts and close the DB."""
+        with self._flush_lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._write_leave_counts()
+            self._conn.close()
+        atexit.unregister(self.close)
 
     def load_logins(self):
         with open(self.logins_path, 'r') as f:
             self.logins = json.load(f)
+        # Student usernames, extracted once for the admin views
+        try:
+            self._student_usernames = tuple(s['username'] for s in self.logins.get('students', []))
+        except Exception:
+            self._student_usernames = ()
 
     def load_answers(self):
         """Load answers from answers.json file."""
@@ -45,6 +103,8 @@ class QuestionManager:
                 self.answers = json.load(f)
         except Exception:
             self.answers = {}
+        # Normalized once so verify_key is a dict lookup and a string compare
+        self._expected_keys = {q: str(a).strip().lower() for q, a in self.answers.items()}
 
     def load_hints(self):
         """Load hints from hints.json file."""
@@ -54,12 +114,26 @@ class QuestionManager:
                 self.hints = json.load(f)
         except Exception:
             self.hints = {}
-            self.logins = json.load(f)
+
+    def _connect(self):
+        """Open the long-lived database connection shared by all methods."""
+        # Autocommit mode; multi-statement writes are serialized by self.lock,
+        # single-statement upserts rely on SQLite's own locking, and WAL lets
+        # readers proceed alongside a writer. No explicit transactions are opened
+        # on this shared connection, so a lock-free statement never joins one.
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                                     cached_statements=256)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-20000")
+        # Same 5 s as sqlite3.connect's default timeout; stated here so the wait for
+        # server.py's own connections is explicit alongside the other pragmas
+        self._conn.execute("PRAGMA busy_timeout=5000")
 
     def _init_db(self):
-        import sqlite3
-        with sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
+        with self.lock:
+            c = self._conn.cursor()
             c.execute('''CREATE TABLE IF NOT EXISTS submissions (
                 username TEXT,
                 question TEXT,
@@ -103,14 +177,22 @@ class QuestionManager:
                 start_time REAL,
                 duration INTEGER
             )''')
-            conn.commit()
 
     def get_question_text(self, qname):
         qpath = os.path.join(self.questions_dir, f"{qname}.txt")
-        if os.path.exists(qpath):
-            with open(qpath, 'r') as f:
-                return f.read()
-        return None
+        try:
+            mtime = os.stat(qpath).st_mtime_ns
+            # Serve from cache unless the file changed on disk since it was read
+            cached = self._qtext_cache.get(qpath)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            with open(qpath, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            # Missing file or a qname that is not a valid path (e.g. "question1.txt/x")
+            return None
+        self._qtext_cache[qpath] = (mtime, text)
+        return text
 
     def start_timer(self, username, qname):
         # Deprecated: per-question timers replaced by a single overall test timer.
@@ -125,194 +207,187 @@ class QuestionManager:
     # --- Global test control ---
     def start_global_test(self, duration=None):
         """Start the global test timer. duration in seconds. Writes a single-row global_test record."""
-        import sqlite3, time
         if duration is None:
             duration = int(self.total_time)
-        with self.lock, sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
+        with self.lock:
+            c = self._conn.cursor()
             # Insert or ignore if already started
-            c.execute("SELECT start_time FROM global_test WHERE id=1")
-            row = c.fetchone()
-            if not row:
-                c.execute("INSERT INTO global_test (id, start_time, duration) VALUES (1, ?, ?)", (time.time(), int(duration)))
-                conn.commit()
+            c.execute("INSERT OR IGNORE INTO global_test (id, start_time, duration) VALUES (1, ?, ?)", (int(time.time()), int(duration)))
+            # Re-seed from the stored row rather than trusting rowcount: it reflects
+            # changes on the whole shared connection, including lock-free writers
+            self._load_global_cache()
 
     def reset_global_test(self):
-        import sqlite3
-        with self.lock, sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
+        with self.lock:
+            c = self._conn.cursor()
             c.execute("DELETE FROM global_test WHERE id=1")
-            conn.commit()
+            self._global_cache = None
+
+    def _load_global_cache(self):
+        """Seed the in-memory global timer from the global_test row, if any."""
+        c = self._conn.cursor()
+        c.execute(self._SQL_GET_GLOBAL_DEADLINE)
+        row = c.fetchone()
+        if row and row[0] is not None:
+            # Anchor the stored wall-clock deadline onto the monotonic clock
+            self._global_cache = time.monotonic_ns() + (row[0] - int(time.time())) * 1_000_000_000
 
     def get_time_left(self, username, qname):
         # Return remaining time for the global test session
-        import sqlite3, time
-        with self.lock, sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute("SELECT start_time, duration FROM global_test WHERE id=1")
-            row = c.fetchone()
-            if row and row[0] and row[1]:
-                start_ts, duration = row[0], row[1]
-                elapsed = time.time() - start_ts
-                left = int(duration - elapsed)
-                return max(0, left)
+        # Lock-free: the deadline is a single int swapped atomically by start/reset
+        deadline = self._global_cache
+        if deadline is None:
             # If global test hasn't started, return full configured total_time
             return int(self.total_time)
+        # Integer math throughout; floor division rounds down like the old int() cast
+        return max(0, (deadline - time.monotonic_ns()) // 1_000_000_000)
 
     def get_global_time_left(self):
         """Return remaining seconds for the global timer (same as get_time_left but without username)."""
         return self.get_time_left(None, None)
 
     def is_global_started(self):
-        import sqlite3
-        with sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute("SELECT start_time FROM global_test WHERE id=1")
-            row = c.fetchone()
-            return bool(row and row[0])
+        c = self._conn.cursor()
+        c.execute("SELECT 1 FROM global_test WHERE id=1 AND start_time IS NOT NULL LIMIT 1")
+        return c.fetchone() is not None
 
     def can_access(self, username, qname):
-        left = self.get_time_left(username, qname)
-        import sqlite3
-        with sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute("SELECT submitted FROM submissions WHERE username=? AND question=?", (username, qname))
-            row = c.fetchone()
-            submitted = bool(row and row[0])
-        return left > 0 and not submitted
+        # Time left is computed in memory; only the submitted flag needs the DB,
+        # and not even that once time is up
+        if self.get_time_left(username, qname) <= 0:
+            return False
+        c = self._conn.cursor()
+        c.execute(self._SQL_IS_SUBMITTED, (username, qname))
+        return c.fetchone() is None
 
     def submit_answer(self, username, qname, file_path):
-        import sqlite3
-        with self.lock:
-            try:
-                # Do not store files; only record submission in database
-                with sqlite3.connect(self.db_path) as conn:
-                    c = conn.cursor()
-                    c.execute("""
-                        INSERT OR REPLACE INTO submissions 
-                        (username, question, submitted, start_time)
-                        VALUES (?, ?, 1, COALESCE(
-                            (SELECT start_time FROM submissions WHERE username=? AND question=?),
-                            ?
-                        ))
-                    """, (username, qname, username, qname, time.time()))
-                    conn.commit()
-            except Exception as e:
-                logging.error(f"Error in submit_answer: {str(e)}")
-                raise
+        # The upsert is a single atomic statement, so SQLite arbitrates concurrent submits
+        try:
+            # Do not store files; only record submission in database
+            c = self._conn.cursor()
+            c.execute(self._SQL_MARK_SUBMITTED, (username, qname, time.time()))
+        except Exception as e:
+            logging.error(f"Error in submit_answer: {str(e)}")
+            raise
 
     def mark_submitted(self, username, qname):
         """Mark a question as submitted without uploading a file (used for key verification)."""
-        import sqlite3, time
-        with self.lock, sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            # Preserve any existing start_time for the question if present
-            c.execute("""
-                INSERT OR REPLACE INTO submissions (username, question, submitted, start_time)
-                VALUES (?, ?, 1, COALESCE((SELECT start_time FROM submissions WHERE username=? AND question=?), ?))
-            """, (username, qname, username, qname, time.time()))
-            conn.commit()
+        c = self._conn.cursor()
+        # Preserve any existing start_time for the question if present
+        c.execute(self._SQL_MARK_SUBMITTED, (username, qname, time.time()))
 
     def has_started(self, username):
         """Return True if the user has started the overall test session."""
-        import sqlite3
-        with sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute("SELECT start_time FROM test_sessions WHERE username=?", (username,))
-            row = c.fetchone()
-            return bool(row and row[0])
+        c = self._conn.cursor()
+        c.execute("SELECT 1 FROM test_sessions WHERE username=? AND start_time IS NOT NULL LIMIT 1", (username,))
+        return c.fetchone() is not None
 
     def get_expected_key(self, qname):
         """Get the expected answer from answers.json."""
         return self.answers.get(qname)
 
+    def verify_key(self, qname, key):
+        """Return True if `key` matches the expected answer for `qname` (case-insensitive)."""
+        expected = self._expected_keys.get(qname)
+        return expected is not None and expected == key.strip().lower()
+
     def get_hint(self, qname):
         """Get the hint for a question from hints.json."""
         return self.hints.get(qname)
 
     def has_submitted(self, username, qname):
-        import sqlite3
-        with sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute("SELECT submitted FROM submissions WHERE username=? AND question=?", (username, qname))
-            row = c.fetchone()
-            return row and row[0]
+        c = self._conn.cursor()
+        c.execute(self._SQL_IS_SUBMITTED, (username, qname))
+        return c.fetchone() is not None
 
     def get_all_submissions(self):
-        import sqlite3
-        result = {}
-        
-        with sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute("SELECT username, question, submitted FROM submissions")
-            rows = c.fetchall()
-            
-            # Initialize result with all students from logins (so admins see every student)
-            try:
-                students = [s['username'] for s in self.logins.get('students', [])]
-            except Exception:
-                students = []
-            for username in students:
-                result[username] = {q: False for q in self.timers.keys()}
-
-            # Also include any users recorded in the submissions DB that might not be in logins
-            for username, _, _ in rows:
-                if username not in result:
-                    result[username] = {q: False for q in self.timers.keys()}
-            
-            # Update with actual submission status
-            for username, question, submitted in rows:
-                result[username][question] = bool(submitted)
-                
-            # No file-system backup: rely solely on DB records
-        
+        template_keys = tuple(self.timers.keys())
+
+        # Initialize result with all students from logins (so admins see every student)
+        result = {username: dict.fromkeys(template_keys, False) for username in self._student_usernames}
+
+        # Single pass over the DB rows; users missing from logins are added on the fly.
+        # No file-system backup: rely solely on DB records
+        c = self._conn.cursor()
+        c.execute("SELECT username, question, submitted FROM submissions")
+        for username, question, submitted in c:
+            result.setdefault(username, dict.fromkeys(template_keys, False))[question] = bool(submitted)
+
         return result
 
     def reset(self):
-        import sqlite3
-        with sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute("DELETE FROM submissions")
-            conn.commit()
+        """Clear all submissions and per-user test sessions."""
+        with self.lock:
+            self._conn.executescript("DELETE FROM submissions; DELETE FROM test_sessions;")
 
     # --- Leave count metrics ---
     def increment_leave_count(self, username):
-        import sqlite3
-        import time
-        with self.lock, sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            # Ensure a row exists
-            c.execute("INSERT OR IGNORE INTO student_metrics (username, leave_count, last_leave_ts) VALUES (?, 0, 0)", (username,))
-            # Read last leave timestamp
-            c.execute("SELECT last_leave_ts FROM student_metrics WHERE username = ?", (username,))
-            row = c.fetchone()
-            last_ts = float(row[0]) if row and row[0] is not None else 0.0
-            now = time.time()
-            # Debounce rapid events: only count if at least 3 seconds since last recorded leave
-            if now - last_ts >= 3.0:
-                c.execute("UPDATE student_metrics SET leave_count = leave_count + 1, last_leave_ts = ? WHERE username = ?", (now, username))
-                conn.commit()
-            else:
-                # Update last_leave_ts to the latest time to avoid repeated near-simultaneous events
-                c.execute("UPDATE student_metrics SET last_leave_ts = ? WHERE username = ?", (now, username))
-                conn.commit()
+        """Record a leave event in memory; it reaches the DB on the next flush."""
+        shard_lock, pending, last_seen = self._leave_shard(username)
+        now = time.time()
+        # The shard is shared with other students and the flusher, so wait for it
+        # rather than drop the event; the critical section is a few dict operations
+        with shard_lock:
+            # Debounce rapid events: only count if at least 3 seconds since the last leave,
+            # but always move the timestamp forward
+            if now - last_seen.get(username, 0.0) >= 3.0:
+                pending[username] = pending.get(username, 0) + 1
+            last_seen[username] = now
+
+    def _leave_shard(self, username):
+        return self._leave_shards[hash(username) & (self.LEAVE_SHARDS - 1)]
+
+    def _flush_leave_counts(self):
+        """Write buffered leave counts to student_metrics unless the manager is closed."""
+        with self._flush_lock:
+            if not self._closed:
+                self._write_leave_counts()
+
+    def _write_leave_counts(self):
+        """Write buffered leave counts; unwritten counts stay buffered. Needs _flush_lock."""
+        rows = []
+        for shard_lock, pending, last_seen in self._leave_shards:
+            with shard_lock:
+                rows.extend((u, n, last_seen[u]) for u, n in pending.items())
+                pending.clear()
+        # Each row commits on its own (cheap with WAL + synchronous=NORMAL) so no
+        # transaction is held open on the shared connection
+        c = self._conn.cursor()
+        for i, row in enumerate(rows):
+            try:
+                c.execute(self._SQL_FLUSH_LEAVES, row)
+            except Exception as e:
+                logging.error(f"Error flushing leave counts: {str(e)}")
+                # Rows from here on were not written; add them back so the next flush retries
+                for username, count, _ in rows[i:]:
+                    shard_lock, pending, _ = self._leave_shard(username)
+                    with shard_lock:
+                        pending[username] = pending.get(username, 0) + count
+                return
+
+    def _schedule_leave_flush(self):
+        """Flush buffered leave counts now and every LEAVE_FLUSH_INTERVAL seconds."""
+        try:
+            self._flush_leave_counts()
+        finally:
+            with self._flush_lock:
+                if not self._closed:
+                    self._flush_timer = Timer(self.LEAVE_FLUSH_INTERVAL, self._schedule_leave_flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
 
     def get_leave_counts(self):
-        import sqlite3
+        # Include events still buffered in memory
+        self._flush_leave_counts()
         result = {}
-        with sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute("SELECT username, leave_count FROM student_metrics")
-            rows = c.fetchall()
-            for username, leave_count in rows:
-                result[username] = leave_count
+        c = self._conn.cursor()
+        c.execute("SELECT username, leave_count FROM student_metrics")
+        rows = c.fetchall()
+        for username, leave_count in rows:
+            result[username] = leave_count
 
         # Ensure all students are present with at least 0
-        try:
-            students = [s['username'] for s in self.logins.get('students', [])]
-        except Exception:
-            students = []
-        for s in students:
+        for s in self._student_usernames:
             result.setdefault(s, 0)
 
         return result
@@ -320,9 +395,8 @@ class QuestionManager:
     # --- Lockout and Retry Tracking ---
     def increment_attempt_count(self, username, qname):
         """Increment the attempt count for a question. If it reaches 3, lock out the student."""
-        import sqlite3
-        with self.lock, sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
+        with self.lock:
+            c = self._conn.cursor()
             # Ensure row exists
             c.execute("INSERT OR IGNORE INTO submissions (username, question, submitted, attempt_count, start_time) VALUES (?, ?, 0, 0, ?)", 
                      (username, qname, time.time()))
@@ -330,8 +404,7 @@ class QuestionManager:
             c.execute("UPDATE submissions SET attempt_count = attempt_count + 1 WHERE username = ? AND question = ?", 
                      (username, qname))
             # Check new count
-            c.execute("SELECT attempt_count FROM submissions WHERE username = ? AND question = ?", 
-                     (username, qname))
+            c.execute(self._SQL_GET_ATTEMPTS, (username, qname))
             row = c.fetchone()
             attempt_count = row[0] if row else 0
             
@@ -340,88 +413,65 @@ class QuestionManager:
                 c.execute("INSERT OR IGNORE INTO student_metrics (username, locked_out) VALUES (?, 1)", (username,))
                 c.execute("UPDATE student_metrics SET locked_out = 1 WHERE username = ?", (username,))
             
-            conn.commit()
             return attempt_count
 
     def get_attempt_count(self, username, qname):
         """Get the current attempt count for a question."""
-        import sqlite3
-        with sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute("SELECT attempt_count FROM submissions WHERE username = ? AND question = ?", 
-                     (username, qname))
-            row = c.fetchone()
-            return row[0] if row else 0
+        c = self._conn.cursor()
+        c.execute(self._SQL_GET_ATTEMPTS, (username, qname))
+        row = c.fetchone()
+        return row[0] if row else 0
 
     def is_locked_out(self, username):
         """Check if a student is locked out (has reached 3 failed attempts on any question)."""
-        import sqlite3
-        with sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute("SELECT locked_out FROM student_metrics WHERE username = ?", (username,))
-            row = c.fetchone()
-            return bool(row and row[0])
+        c = self._conn.cursor()
+        c.execute(self._SQL_IS_LOCKED_OUT, (username,))
+        row = c.fetchone()
+        return bool(row and row[0])
 
     def lock_out_student(self, username):
         """Lock out a student from the system."""
-        import sqlite3
-        with self.lock, sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
+        with self.lock:
+            c = self._conn.cursor()
             c.execute("INSERT OR IGNORE INTO student_metrics (username, locked_out) VALUES (?, 1)", (username,))
             c.execute("UPDATE student_metrics SET locked_out = 1 WHERE username = ?", (username,))
-            conn.commit()
 
     def unlock_student(self, username):
         """Unlock a student (admin reset)."""
-        import sqlite3
-        with self.lock, sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
+        with self.lock:
+            c = self._conn.cursor()
             c.execute("UPDATE student_metrics SET locked_out = 0 WHERE username = ?", (username,))
             # Also reset attempt counts for all questions
             c.execute("UPDATE submissions SET attempt_count = 0 WHERE username = ?", (username,))
-            conn.commit()
 
     def get_all_lockout_status(self):
         """Get lockout status for all students."""
-        import sqlite3
         result = {}
-        with sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute("SELECT username, locked_out FROM student_metrics WHERE locked_out = 1")
-            rows = c.fetchall()
-            for username, locked_out in rows:
-                result[username] = bool(locked_out)
+        c = self._conn.cursor()
+        c.execute("SELECT username, locked_out FROM student_metrics WHERE locked_out = 1")
+        rows = c.fetchall()
+        for username, locked_out in rows:
+            result[username] = bool(locked_out)
         
         # Ensure all students are present
-        try:
-            students = [s['username'] for s in self.logins.get('students', [])]
-        except Exception:
-            students = []
-        for s in students:
+        for s in self._student_usernames:
             result.setdefault(s, False)
         
         return result
 
     def get_all_attempt_counts(self):
         """Get all attempt counts organized by username and question."""
-        import sqlite3
         result = {}
-        with sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute("SELECT username, question, attempt_count FROM submissions")
-            rows = c.fetchall()
-            for username, question, attempt_count in rows:
-                if username not in result:
-                    result[username] = {}
-                result[username][question] = attempt_count
+        c = self._conn.cursor()
+        c.execute("SELECT username, question, attempt_count FROM submissions")
+        rows = c.fetchall()
+        for username, question, attempt_count in rows:
+            if username not in result:
+                result[username] = {}
+            result[username][question] = attempt_count
         
         # Ensure all students are present with all questions initialized to 0
-        try:
-            students = [s['username'] for s in self.logins.get('students', [])]
-        except Exception:
-            students = []
-        
-        for s in students:
+        for s in self._student_usernames:
             if s not in result:
                 result[s] = {}
             for q in self.timers.keys():
@@ -245,7 +245,7 @@ def question():
         if expected is None:
             return render_template('question.html', qname=qname, time_left=qm.get_global_time_left(), question_text=qm.get_question_text(qname), hint=qm.get_hint(qname), error='No expected key configured for this mission.')
 
-        if provided.lower() == expected.lower():
+        if qm.verify_key(qname, provided):
             try:
                 qm.mark_submitted(current_user.id, qname)
             except Exception:
@@ -435,13 +435,10 @@ def reset_database():
         return redirect(url_for('dashboard'))
     
     try:
-        # Reset database entries related to progress and global test
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute("DELETE FROM submissions")
-            c.execute("DELETE FROM global_test WHERE id=1")
-            c.execute("DELETE FROM test_sessions")
-            conn.commit()
+        # Reset database entries related to progress and global test.
+        # Go through the manager so its cached global timer is cleared too.
+        qm.reset()
+        qm.reset_global_test()
             
         # Clear error logs
         global errors